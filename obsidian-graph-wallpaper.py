@@ -1,68 +1,402 @@
 import os
 import re
 import time
-import math
 import ctypes
+import hashlib
+import io
+import queue
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import matplotlib
 matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import networkx as nx
+import numpy as np
+from PIL import Image
+from scipy.spatial import cKDTree
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the per-pair push stays in NumPy without it
+    njit = None
+
+try:
+    from fa2 import ForceAtlas2
+except ImportError:  # fa2 is optional; igraph or networkx is used without it
+    ForceAtlas2 = None
+
+try:
+    import igraph as ig
+except ImportError:  # igraph is optional; networkx's spring layout is used without it
+    ig = None
+
 # Change both paths: first is the location of your vault, second is the location of where you want the output png
 VAULT_PATH = r"C:\Users\Tomas\Main Obsidian Vault"
 OUTPUT_IMAGE = r"C:\Users\Tomas\OneDrive\Pictures\Wallpaper Pic\obsidian_graph.png"
 
+# Upper bound on force-directed layout passes. Spring layout already stops
+# early once the mean node movement per pass drops below its threshold;
+# LAYOUT_THRESHOLD relaxes networkx's default of 1e-4 so it stops sooner
+LAYOUT_ITERATIONS = 500
+LAYOUT_THRESHOLD = 1e-3
+
+# Passes when starting from the previous update's layout
+WARM_START_ITERATIONS = 50
+
+# Seconds between full vault rescans; events in between are applied incrementally
+FULL_RESCAN_INTERVAL = 10 * 60
+
+# Notes are scanned for links this many bytes at a time instead of read whole
+READ_CHUNK_SIZE = 64 * 1024
+
+_WIKILINK = re.compile(rb"\[\[([^\]]+)\]\]")
+_SPLIT = re.compile(r"[#|]")
+
+# Vault state kept between updates so events only re-parse the files they touch
+_G = None               # every note plus linked attachments, orphans included
+_file_dict = {}         # filename -> full path
+_links_by_file = {}     # .md filename -> link targets written in that note
+_duplicate_names = set()  # filenames found at more than one path in the last scan
+_last_full_scan = 0.0
+
+# Signature of the last graph that was drawn, to skip identical redraws
+_LAST_SIG = None
+
+# Hash of the last PNG written, so identical renders skip the disk and Windows
+_LAST_PNG_HASH = None
+
+# Unscaled positions and neighbour sets from the last layout, see compute_layout
+_LAST_POS = {}
+_LAST_NEIGHBORS = {}
+
+# Figure and Axes reused across renders, see _get_canvas
+_FIG = None
+_AX = None
+
 def set_wallpaper_windows(image_path):
     """
     Update the Windows desktop wallpaper.
     """
     ctypes.windll.user32.SystemParametersInfoW(20, 0, image_path, 0)
 
+def _walk(directory):
+    """
+    Yield (filename, full path) for every file under directory.
+    Like os.walk, a directory's files come before its subdirectories
+    (so duplicate names resolve the same way) and unreadable
+    directories are skipped silently.
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    yield entry.name, entry.path
+    except OSError:
+        return
+    for subdir in subdirs:
+        yield from _walk(subdir)
+
+def _find_wikilinks(f):
+    """
+    Run _WIKILINK over a binary file READ_CHUNK_SIZE bytes at a time.
+    A link that may still be open at the end of a chunk is carried into
+    the next one, so the matches are the same as for the whole file.
+    """
+    found = []
+    carry = b""
+    while True:
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            return found
+        buf = carry + chunk
+        end = 0
+        for m in _WIKILINK.finditer(buf):
+            found.append(m.group(1))
+            end = m.end()
+        # Any "]" short of the last byte closes off every [[ opened before it
+        start = max(end, buf.rfind(b"]", end, len(buf) - 1) + 1)
+        open_at = buf.find(b"[[", start)
+        if open_at == -1:
+            # Keep a lone trailing "[" in case the next chunk starts with one
+            open_at = len(buf) - 1 if buf.endswith(b"[") and len(buf) > start else len(buf)
+        carry = buf[open_at:]
+
+def _read_links(md_path):
+    """
+    Return the filenames a note links to with [[...]], as dict keys in
+    the order they first appear, so the graph is built in file order.
+    Links without an extension refer to notes, so ".md" is appended.
+    """
+    # Match on raw bytes so the file never has to be decoded as a whole,
+    # and in chunks rather than a whole-file read or an mmap: Windows
+    # won't let Obsidian truncate or overwrite a note while it is mapped
+    with open(md_path, "rb") as f:
+        raw_links = _find_wikilinks(f)
+
+    links = {}
+    for raw in raw_links:
+        link = raw.decode("utf-8", "replace")
+        link_clean = _SPLIT.split(link, 1)[0].strip()
+        if "." not in link_clean:
+            link_clean += ".md"
+        links[link_clean] = None
+    return links
+
+def _set_note_links(md_name, links):
+    """
+    Replace a note's outgoing links, adding and removing only the
+    edges that differ from what the note linked to before.
+    """
+    old = _links_by_file.get(md_name, {})
+    _links_by_file[md_name] = links
+    _G.add_node(md_name)
+
+    # Walk the links in file order (not a set difference) so nodes enter
+    # the graph in the same order every run and seeded layouts repeat
+    for target in links:
+        if target not in old and target in _file_dict:
+            _G.add_edge(md_name, target)
+
+    for target in old:
+        if target in links:
+            continue
+        # Keep the edge if the other note still links back to this one
+        if md_name in _links_by_file.get(target, ()):
+            continue
+        if _G.has_edge(md_name, target):
+            _G.remove_edge(md_name, target)
+
+def _add_file(name, path):
+    """
+    Track a created or modified file and (re)parse it if it's a note.
+    """
+    is_new = name not in _file_dict
+    _file_dict[name] = path
+
+    if is_new:
+        # Notes that already linked to this name can now resolve it
+        for src, links in _links_by_file.items():
+            if name in links:
+                _G.add_edge(src, name)
+
+    if name.lower().endswith(".md"):
+        _set_note_links(name, _read_links(path))
+
+def _remove_file(name, path):
+    """
+    Drop a deleted file's node, its edges and its outgoing links.
+    """
+    if _file_dict.get(name) != path:
+        # Another file with the same name is the one in the graph
+        return
+    del _file_dict[name]
+    _links_by_file.pop(name, None)
+    if _G.has_node(name):
+        _G.remove_node(name)
+
+def invalidate_vault_graph():
+    """
+    Forget the incremental graph state so the next update does a full scan.
+    """
+    global _G
+    _G = None
+
+def _visible_graph():
+    """
+    Copy of the vault graph without orphan (degree-0) nodes.
+    """
+    return _G.subgraph([n for n in _G.nodes if _G.degree(n) > 0]).copy()
+
 def build_vault_graph(vault_directory):
     """
     1) Parse .md files for wikilinks: [[...]]
     2) Also track attachments (non-.md files) so we can represent them as orange nodes.
     3) Create edges from an .md note to any file (md or not) if we see a wikilink referencing it.
     4) Remove orphan (degree-0) nodes so they don't appear in the graph.
+    The full scan is remembered so later events can use update_vault_graph.
     """
-    wikilink_pattern = re.compile(r"\[\[([^\]]+)\]\]")
-    G = nx.Graph()
+    global _G, _last_full_scan
+    _G = nx.Graph()
+    _file_dict.clear()
+    _links_by_file.clear()
+    _duplicate_names.clear()
 
-    file_dict = {}
-    for root, dirs, files in os.walk(vault_directory):
-        for filename in files:
-            full_path = os.path.join(root, filename)
-            file_dict[filename] = full_path
+    # Like the old os.walk loop, the last file seen with a name wins
+    for name, path in _walk(vault_directory):
+        if name in _file_dict:
+            _duplicate_names.add(name)
+        _file_dict[name] = path
 
-    for md_name, md_path in file_dict.items():
-        if not md_name.lower().endswith(".md"):
-            continue
+    md_files = [n for n in _file_dict if n.lower().endswith(".md")]
+    md_paths = [_file_dict[n] for n in md_files]
+
+    # Reading is I/O bound, so the threads overlap well; the graph itself
+    # is only touched from this thread since networkx isn't thread-safe
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        results = list(ex.map(_read_links, md_paths))
+
+    for md_name, links in zip(md_files, results):
+        _set_note_links(md_name, links)
 
-        if not G.has_node(md_name):
-            G.add_node(md_name)
+    _last_full_scan = time.monotonic()
+    return _visible_graph()
+
+def _is_relevant(event):
+    """
+    Whether an event can change the graph: directory structure changes,
+    notes, and files that some note links to. Everything else (e.g.
+    .obsidian/workspace.json) only needs to be recorded, not drawn.
+    """
+    if event.is_directory:
+        return event.event_type in {"created", "deleted", "moved"}
+
+    paths = [event.src_path]
+    if event.event_type == "moved":
+        paths.append(event.dest_path)
+    for path in paths:
+        name = os.path.basename(path)
+        if name.lower().endswith(".md"):
+            return True
+        if any(name in links for links in _links_by_file.values()):
+            return True
+    return False
+
+def _shares_name(path):
+    """
+    Whether path's filename also belongs to another file in the vault.
+    Which of them the graph uses depends on walk order, so creating,
+    deleting or moving such a file is left to a full scan.
+    """
+    name = os.path.basename(path)
+    return name in _duplicate_names or _file_dict.get(name, path) != path
 
-        with open(md_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            links = wikilink_pattern.findall(content)
-            
-            for link in links:
-                link_clean = re.split(r"[#|]", link)[0].strip()
-                if "." not in link_clean:
-                    link_clean += ".md"
+def graph_signature(G):
+    """
+    Cheap fingerprint of a graph's node and edge sets.
+    """
+    return hash((frozenset(G.nodes), frozenset(map(frozenset, G.edges))))
 
-                if link_clean in file_dict:
-                    if not G.has_node(link_clean):
-                        G.add_node(link_clean)
-                    G.add_edge(md_name, link_clean)
+def update_vault_graph(vault_directory, events):
+    """
+    Apply watchdog events to the graph from the last scan, re-parsing
+    only the files they name. Falls back to a full build_vault_graph
+    when there is no previous scan, when it is older than
+    FULL_RESCAN_INTERVAL, when a directory was created/moved/deleted,
+    or when a file sharing its name with another one came or went.
+    """
+    if _G is None or time.monotonic() - _last_full_scan > FULL_RESCAN_INTERVAL:
+        return build_vault_graph(vault_directory)
 
-    # Remove orphan (degree-0) nodes
-    orphans = [n for n in G.nodes() if G.degree(n) == 0]
-    G.remove_nodes_from(orphans)
+    for event in events:
+        if event.is_directory:
+            if event.event_type in {"created", "deleted", "moved"}:
+                return build_vault_graph(vault_directory)
+            continue
 
-    return G
+        if event.event_type == "modified":
+            name = os.path.basename(event.src_path)
+            if name in _duplicate_names and _file_dict.get(name) != event.src_path:
+                # The other file with this name is the one in the graph
+                continue
+        elif event.event_type in {"created", "deleted", "moved"}:
+            paths = [event.src_path]
+            if event.event_type == "moved":
+                paths.append(event.dest_path)
+            if any(_shares_name(p) for p in paths):
+                return build_vault_graph(vault_directory)
+
+        changes = []
+        if event.event_type in {"modified", "created"}:
+            changes.append(event.src_path)
+        elif event.event_type == "deleted":
+            _remove_file(os.path.basename(event.src_path), event.src_path)
+        elif event.event_type == "moved":
+            _remove_file(os.path.basename(event.src_path), event.src_path)
+            changes.append(event.dest_path)
+
+        for path in changes:
+            name = os.path.basename(path)
+            try:
+                if os.path.isfile(path):
+                    _add_file(name, path)
+                    continue
+            except FileNotFoundError:
+                pass
+            # Temporary file that was gone again before we got to it
+            _remove_file(name, path)
+
+    return _visible_graph()
+
+if njit is not None:
+    @njit(cache=True)
+    def _push_pairs_numba(P, pairs, min_dist):
+        """
+        Compiled version of the per-pair push in _relax_kdtree: every pair
+        is pushed from the positions at the start of the pass. Returns how
+        many pairs moved.
+        """
+        delta = np.zeros_like(P)
+        moved = 0
+        for k in range(pairs.shape[0]):
+            i = pairs[k, 0]
+            j = pairs[k, 1]
+            dx = P[j, 0] - P[i, 0]
+            dy = P[j, 1] - P[i, 1]
+            dist = np.sqrt(dx * dx + dy * dy)
+            if dist > 1e-9:
+                overlap = 0.5 * (min_dist - dist)
+                ux = dx / dist
+                uy = dy / dist
+                delta[i, 0] -= overlap * ux
+                delta[i, 1] -= overlap * uy
+                delta[j, 0] += overlap * ux
+                delta[j, 1] += overlap * uy
+                moved += 1
+        P += delta
+        return moved
+else:
+    _push_pairs_numba = None
+
+def _push_pairs(P, pairs, min_dist):
+    """
+    Push every colliding pair apart in place, using the positions at the
+    start of the pass. Returns how many pairs moved.
+    """
+    d = P[pairs[:, 1]] - P[pairs[:, 0]]
+    dist = np.linalg.norm(d, axis=1)
+    mask = dist > 1e-9
+    if not mask.any():
+        return 0
+    overlap = np.where(mask, 0.5 * (min_dist - dist), 0.0)
+    u = d / np.where(mask, dist, 1.0)[:, None]
+    disp = overlap[:, None] * u
+    np.add.at(P, pairs[:, 0], -disp)
+    np.add.at(P, pairs[:, 1], disp)
+    return int(mask.sum())
+
+def _relax_kdtree(P, min_dist, iterations):
+    """
+    Collision relaxation that only visits colliding pairs,
+    found with a KD-tree on each pass.
+    """
+    push = _push_pairs_numba if _push_pairs_numba is not None else _push_pairs
+    P = P.copy()
+    for _ in range(iterations):
+        tree = cKDTree(P)
+        pairs = tree.query_pairs(min_dist, output_type='ndarray')
+        if len(pairs) == 0:
+            break
+        if push(P, pairs, float(min_dist)) == 0:
+            break
+    return P
 
 def enforce_min_distance(pos, min_dist=0.05, iterations=10):
     """
@@ -71,25 +405,136 @@ def enforce_min_distance(pos, min_dist=0.05, iterations=10):
     repeat this procedure. Higher => more separation, but slower.
     """
     nodes = list(pos.keys())
-    for _ in range(iterations):
-        moved = False
-        for i in range(len(nodes)):
-            for j in range(i+1, len(nodes)):
-                n1, n2 = nodes[i], nodes[j]
-                x1, y1 = pos[n1]
-                x2, y2 = pos[n2]
-                dx = x2 - x1
-                dy = y2 - y1
-                dist = math.sqrt(dx*dx + dy*dy)
-                if dist < min_dist and dist > 1e-9:
-                    overlap = 0.5 * (min_dist - dist)
-                    ux = dx / dist
-                    uy = dy / dist
-                    pos[n1] = (x1 - overlap * ux, y1 - overlap * uy)
-                    pos[n2] = (x2 + overlap * ux, y2 + overlap * uy)
-                    moved = True
-        if not moved:
-            break
+    if len(nodes) < 2:
+        return
+    P = np.ascontiguousarray([pos[n] for n in nodes], dtype=np.float64)
+    P = _relax_kdtree(P, min_dist, iterations)
+
+    for i, n in enumerate(nodes):
+        pos[n] = (P[i, 0], P[i, 1])
+
+def _warm_start_positions(H, init):
+    """
+    Starting position for every node of H: the previous position where
+    known, otherwise the centroid of its already-placed neighbours.
+    """
+    start = dict(init)
+    for n in H:
+        if n not in start:
+            known = [init[m] for m in H[n] if m in init]
+            start[n] = tuple(np.mean(known, axis=0)) if known else (0.0, 0.0)
+    return start
+
+def _layout_fa2(H, init, iterations):
+    """
+    Barnes-Hut ForceAtlas2 from fa2. fa2's networkx helper ignores edge
+    weights and calls to_scipy_sparse_matrix, which networkx 3 removed,
+    so the weighted adjacency is built here and passed to forceatlas2.
+    fa2 has no fixed nodes and needs a start for every node.
+    """
+    nodes = list(H)
+    M = nx.to_scipy_sparse_array(H, nodelist=nodes, weight='weight', dtype='f', format='lil')
+    if init:
+        start = _warm_start_positions(H, init)
+        start = np.array([start[n] for n in nodes], dtype=np.float64)
+    else:
+        # fa2 would otherwise start from the unseeded global random module
+        start = np.random.default_rng(42).random((len(nodes), 2))
+
+    fa = ForceAtlas2(
+        barnesHutOptimize=True,
+        barnesHutTheta=1.2,
+        scalingRatio=2.0,
+        gravity=1.0,
+        edgeWeightInfluence=1.0,
+        verbose=False
+    )
+    layout = fa.forceatlas2(M, pos=start, iterations=iterations)
+    return {n: tuple(p) for n, p in zip(nodes, layout)}
+
+def _layout_igraph(H, init, fixed, iterations):
+    """
+    Fruchterman-Reingold from igraph's C core. Fixed nodes are pinned by
+    giving them zero-width coordinate bounds.
+    """
+    nodes = list(H)
+    idx = {n: i for i, n in enumerate(nodes)}
+    edges = list(H.edges(data='weight'))
+    g = ig.Graph(n=len(nodes), edges=[(idx[u], idx[v]) for u, v, _ in edges])
+
+    if init:
+        start = _warm_start_positions(H, init)
+        seed = [list(start[n]) for n in nodes]
+        fixed = set(fixed)
+        inf = float("inf")
+        bounds = {
+            "minx": [start[n][0] if n in fixed else -inf for n in nodes],
+            "maxx": [start[n][0] if n in fixed else inf for n in nodes],
+            "miny": [start[n][1] if n in fixed else -inf for n in nodes],
+            "maxy": [start[n][1] if n in fixed else inf for n in nodes],
+        }
+    else:
+        # Seeded random start so a fresh layout is reproducible, like seed=42 below
+        half = np.sqrt(len(nodes)) / 2
+        seed = np.random.default_rng(42).uniform(-half, half, (len(nodes), 2)).tolist()
+        bounds = {}
+
+    # igraph also draws from its own RNG during the layout; reseed it so
+    # the same graph always lays out the same way
+    ig.set_random_number_generator(random.Random(42))
+    layout = g.layout_fruchterman_reingold(
+        weights=[w for _, _, w in edges],
+        niter=iterations,
+        seed=seed,
+        **bounds
+    )
+    return {n: tuple(layout[i]) for i, n in enumerate(nodes)}
+
+def compute_layout(H):
+    """
+    Lay out the connected part of the graph. Uses the Barnes-Hut
+    ForceAtlas2 from fa2 when available, then igraph's C-backed
+    Fruchterman-Reingold, then networkx's spring layout. Whichever runs,
+    the result is scaled to roughly [-1, 1].
+
+    If most nodes were in the previous layout, it's used as the starting
+    point and only WARM_START_ITERATIONS passes run. With igraph and
+    spring layout, nodes whose links didn't change are also held in
+    place, so an edit only moves the part of the picture it touched.
+    """
+    global _LAST_POS, _LAST_NEIGHBORS
+    if H.number_of_nodes() == 0:
+        return {}
+
+    init = {n: _LAST_POS[n] for n in H if n in _LAST_POS}
+    if len(init) < H.number_of_nodes() / 2:
+        init = {}
+    iterations = WARM_START_ITERATIONS if init else LAYOUT_ITERATIONS
+    fixed = [n for n in init if set(H[n]) == _LAST_NEIGHBORS.get(n)]
+
+    if ForceAtlas2 is not None:
+        pos = _layout_fa2(H, init, iterations)
+    elif ig is not None:
+        pos = _layout_igraph(H, init, fixed, iterations)
+    else:
+        pos = nx.spring_layout(
+            H,
+            k=3.0,
+            pos=init or None,
+            fixed=fixed or None,
+            iterations=iterations,
+            threshold=LAYOUT_THRESHOLD,
+            seed=42,
+            weight='weight',
+            scale=None
+        )
+
+    # Keep the unscaled layout so the next warm start runs in the same units
+    _LAST_POS = dict(pos)
+    _LAST_NEIGHBORS = {n: set(H[n]) for n in H}
+
+    # Scale to [-1, 1] so min_dist and the isolate ring keep their meaning
+    return nx.rescale_layout_dict(pos, scale=1)
 
 def print_self_loops(G):
     """
@@ -103,6 +548,22 @@ def print_self_loops(G):
     else:
         print("[INFO] No self-loops found in the graph.")
 
+def _get_canvas():
+    """
+    Return the Figure and Axes shared by every render, creating them on
+    first use so updates don't rebuild the figure and Agg canvas.
+    """
+    global _FIG, _AX
+    if _FIG is None:
+        # Size the figure so figsize * dpi is exactly the wallpaper resolution
+        wallpaper_width = 1920
+        wallpaper_height = 1080
+        dpi = 100
+        _FIG = plt.figure(figsize=(wallpaper_width / dpi, wallpaper_height / dpi), dpi=dpi)
+        _FIG.patch.set_facecolor("#1A1A40")
+        _AX = _FIG.add_subplot(111)
+    return _FIG, _AX
+
 def draw_graph_and_save(G, output_path):
     """
     Draw the graph:
@@ -110,57 +571,47 @@ def draw_graph_and_save(G, output_path):
       - Place isolated nodes in a ring (if any remain)
       - Enforce min distance to avoid node collisions
       - Straight line edges (no connectionstyle)
+    Returns True if output_path was (re)written, False if the PNG came
+    out byte-identical to the last one and the file was left alone.
     """
-    plt.clf()
-    
-    # Set the figure size to match the aspect ratio of your wallpaper
-    wallpaper_width = 1920
-    wallpaper_height = 1080
-    aspect_ratio = wallpaper_width / wallpaper_height
-    fig = plt.figure(figsize=(12 * aspect_ratio, 12))
-    fig.patch.set_facecolor("#1A1A40")
+    global _LAST_PNG_HASH
+    fig, ax = _get_canvas()
+    ax.clear()
+
+    # Degrees are looked up per edge and per node below; compute them once
+    deg = dict(G.degree())
 
     # Give leaf edges a higher weight
-    for u, v in G.edges():
-        if G.degree(u) == 1 or G.degree(v) == 1:
-            G[u][v]['weight'] = 5.0
-        else:
-            G[u][v]['weight'] = 1.0
+    for u, v, d in G.edges(data=True):
+        d['weight'] = 5.0 if deg[u] == 1 or deg[v] == 1 else 1.0
 
     # Identify isolates vs. connected nodes
-    isolates = [n for n in G.nodes if G.degree(n) == 0]
-    connected_nodes = [n for n in G.nodes if G.degree(n) > 0]
+    isolates = [n for n in G.nodes if deg[n] == 0]
+    connected_nodes = [n for n in G.nodes if deg[n] > 0]
     H = G.subgraph(connected_nodes)
 
-    # Spring layout
-    pos_connected = nx.spring_layout(
-        H,
-        k=3.0,
-        iterations=500,
-        seed=42,
-        weight='weight'
-    )
+    # Force-directed layout
+    pos_connected = compute_layout(H)
     pos = dict(pos_connected)
 
     # Place isolated nodes (if any remain) in a ring around the bounding box
     if isolates:
-        xs = [p[0] for p in pos_connected.values()]
-        ys = [p[1] for p in pos_connected.values()]
-        if xs and ys:
-            center_x = (min(xs) + max(xs)) / 2
-            center_y = (min(ys) + max(ys)) / 2
-            radius = max((max(xs) - center_x), (max(ys) - center_y)) + 0.5
+        if pos_connected:
+            P = np.array(list(pos_connected.values()), dtype=np.float64)
+            lo = P.min(axis=0)
+            hi = P.max(axis=0)
+            center_x, center_y = (lo + hi) / 2
+            radius = np.max(hi - (lo + hi) / 2) + 0.5
         else:
             center_x = 0
             center_y = 0
             radius = 1
 
-        angle_step = 2 * math.pi / max(len(isolates), 1)
-        for i, node in enumerate(isolates):
-            angle = i * angle_step
-            ix = center_x + radius * math.cos(angle)
-            iy = center_y + radius * math.sin(angle)
-            pos[node] = (ix, iy)
+        angles = np.linspace(0, 2 * np.pi, len(isolates), endpoint=False)
+        ix = center_x + radius * np.cos(angles)
+        iy = center_y + radius * np.sin(angles)
+        for node, x, y in zip(isolates, ix, iy):
+            pos[node] = (x, y)
 
     # Enforce minimum distance to avoid node overlap
     enforce_min_distance(pos, min_dist=0.05, iterations=15)
@@ -170,16 +621,23 @@ def draw_graph_and_save(G, output_path):
     attachment_nodes = [n for n in G.nodes if not n.lower().endswith(".md")]
 
     # Node sizes
-    node_sizes = {n: 10 + (G.degree(n) * 3) for n in G.nodes()}
-
-    # Draw edges (no connectionstyle => no warning)
-    nx.draw_networkx_edges(
-        G,
-        pos,
+    node_sizes = {n: 10 + (deg[n] * 3) for n in G.nodes()}
+
+    # Draw all edges as one collection of straight segments. A single
+    # NaN-separated ax.plot line looks like it should be cheaper, but Agg
+    # strokes it 2-3x slower and crossing edges no longer blend, and
+    # rasterized=True changes nothing when the output is already Agg
+    segments = np.array(
+        [(pos[u], pos[v]) for u, v in G.edges()], dtype=np.float64
+    ).reshape(-1, 2, 2)
+    ax.add_collection(LineCollection(
+        segments,
+        colors="#444B5D",
+        linewidths=0.75,
         alpha=0.4,
-        edge_color="#444B5D",
-        width=0.75
-    )
+        antialiaseds=True
+    ))
+    ax.autoscale_view()
 
     # (A) Define the special note filenames exactly as they appear on disk:
     #     If your actual file names are "🧠 Personal.md", etc., match those here.
@@ -192,61 +650,148 @@ def draw_graph_and_save(G, output_path):
     
     # (B) Filter out the actual special nodes present in the graph
     special_md_nodes = [n for n in md_nodes if n in special_note_names]
-
-    # (C) Draw the special nodes in #b6616b
-    nx.draw_networkx_nodes(
-        G,
-        pos,
-        nodelist=special_md_nodes,
-        node_size=[node_sizes[n] for n in special_md_nodes],
-        node_color="#00FFFF",
-        alpha=0.9
+    regular_md_nodes = [n for n in md_nodes if n not in special_note_names]
+
+    # (C) Draw every node in one scatter call. Order matches the old
+    #     per-group draws so attachments stay on top, then regular notes,
+    #     then the special notes (#00FFFF) underneath.
+    node_colors = (
+        [("#00FFFF", n) for n in special_md_nodes]
+        + [("#FF00FF", n) for n in regular_md_nodes]
+        + [("#007FFF", n) for n in attachment_nodes]
     )
-
-    # (D) Draw remaining md nodes in the original color
-    regular_md_nodes = list(set(md_nodes) - set(special_md_nodes))
-    nx.draw_networkx_nodes(
-        G,
-        pos,
-        nodelist=regular_md_nodes,
-        node_size=[node_sizes[n] for n in regular_md_nodes],
-        node_color="#FF00FF",
-        alpha=0.9
-    )
-
-    # (E) Draw attachments (unchanged)
-    nx.draw_networkx_nodes(
-        G,
-        pos,
-        nodelist=attachment_nodes,
-        node_size=[node_sizes[n] for n in attachment_nodes],
-        node_color="#007FFF",
-        alpha=0.9
-    )
-
-    plt.axis("off")
-    ax = plt.gca()
+    if node_colors:
+        P = np.array([pos[n] for _, n in node_colors], dtype=np.float64)
+        ax.scatter(
+            P[:, 0],
+            P[:, 1],
+            s=np.array([node_sizes[n] for _, n in node_colors]),
+            c=[c for c, _ in node_colors],
+            alpha=0.9,
+            zorder=2
+        )
+
+    ax.set_axis_off()
     ax.set_aspect("equal", "box")
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=400, facecolor=fig.get_facecolor())
-    plt.close()
+    fig.tight_layout()
+
+    # Render once to Agg and encode the raw RGBA buffer ourselves,
+    # skipping savefig's backend dispatch
+    fig.canvas.draw()
+    img = Image.frombuffer(
+        "RGBA",
+        fig.canvas.get_width_height(),
+        fig.canvas.buffer_rgba(),
+        "raw",
+        "RGBA",
+        0,
+        1
+    )
+    buf = io.BytesIO()
+    img.save(buf, "PNG", compress_level=1)
+    png = buf.getvalue()
+
+    png_hash = hashlib.blake2b(png, digest_size=16).digest()
+    if png_hash == _LAST_PNG_HASH:
+        return False
+
+    # Write next to the target and swap it in, so the wallpaper is never
+    # read half-written and sync clients only see a changed file
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(png)
+    os.replace(tmp_path, output_path)
+    _LAST_PNG_HASH = png_hash
+    return True
+
+def update_wallpaper(events=None):
+    """
+    Rebuild the graph (incrementally when events are given) and redraw,
+    unless nothing that affects the picture changed.
+    """
+    global _LAST_SIG
+    if events is None:
+        G = build_vault_graph(VAULT_PATH)
+    else:
+        # Check before applying, while deleted files' links are still known
+        relevant = any(_is_relevant(e) for e in events)
+        last_scan = _last_full_scan
+        G = update_vault_graph(VAULT_PATH, events)
+        # A full rescan may have picked up changes the events didn't show
+        if not relevant and _last_full_scan == last_scan:
+            return
+
+    sig = graph_signature(G)
+    if sig == _LAST_SIG:
+        print("[INFO] Graph unchanged; wallpaper left as is.")
+        return
 
-def update_wallpaper():
-    G = build_vault_graph(VAULT_PATH)
     print_self_loops(G)
-    draw_graph_and_save(G, OUTPUT_IMAGE)
+    changed = draw_graph_and_save(G, OUTPUT_IMAGE)
+    # Only remember the graph once it's actually on disk, so a failed
+    # render or write is retried on the next batch
+    _LAST_SIG = sig
+    if not changed:
+        print("[INFO] Rendered image unchanged; wallpaper left as is.")
+        return
     set_wallpaper_windows(OUTPUT_IMAGE)
     print("[INFO] Wallpaper updated.")
 
 class VaultChangeHandler(FileSystemEventHandler):
+    """
+    Hand filesystem events to a single consumer thread so watchdog's
+    thread never blocks on a render. Events are collected in a list and
+    only a wake-up signal goes through the one-slot queue; the consumer
+    waits for 'delay' seconds of quiet (at most 'max_delay' in total)
+    and then runs one update for the whole batch.
+    """
+    def __init__(self, delay=0.3, max_delay=5.0):
+        super().__init__()
+        self._delay = delay
+        self._max_delay = max_delay
+        self._lock = threading.Lock()
+        self._events = []
+        self._queue = queue.Queue(maxsize=1)
+
     def on_any_event(self, event):
         print(f"[UPDATE] Change detected: {event.event_type} - {event.src_path}")
-        update_wallpaper()
+        with self._lock:
+            self._events.append(event)
+        try:
+            self._queue.put_nowait(1)
+        except queue.Full:
+            # The consumer is already due to wake up
+            pass
+
+    def consume(self):
+        """
+        Consumer loop; run it on its own (daemon) thread.
+        """
+        while True:
+            self._queue.get()
+            deadline = time.monotonic() + self._max_delay
+            while time.monotonic() < deadline:
+                time.sleep(self._delay)
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            with self._lock:
+                events, self._events = self._events, []
+            try:
+                update_wallpaper(events)
+            except Exception as e:
+                # The batch may have been applied only partly, so the graph
+                # state can't be trusted; the next batch rescans the vault
+                invalidate_vault_graph()
+                print(f"[ERROR] Wallpaper update failed: {e}")
 
 if __name__ == "__main__":
     update_wallpaper()
     event_handler = VaultChangeHandler()
+    threading.Thread(target=event_handler.consume, daemon=True).start()
     observer = Observer()
     observer.schedule(event_handler, VAULT_PATH, recursive=True)
     observer.start()